@@ -49,7 +49,10 @@ class ValidationContext:
     template_dir: str
     validation_failures: list[tuple[FailureType, str]] = dataclasses.field(default_factory=list)
 
-    def add_failure(self, failure_type: FailureType, message: str):
+    def add_failure(self, failure_type: FailureType, message: str, *args: Any):
+        """Records a validation failure, the message is %-formatted with args if any are given"""
+        if args:
+            message = message % args
         self.validation_failures.append((failure_type, message))
 
     def property_equals(self, model_object, key, value):
@@ -169,6 +172,8 @@ class ModelObject(ABC):
     The abstract base class for any model object.
     """
 
+    __slots__ = ()
+
     def __post_init__(self):
         """
         Assigns to all field which are UNSET their default value, if one is available.
@@ -9,10 +9,11 @@
 from __future__ import annotations
 
 import dataclasses
-import re
+import sys
+from functools import cache
 from typing import Any, cast
 
-from jsonbender import Forall, K, OptionalS, S, bend  # type: ignore
+from jsonbender import F, K, OptionalS, S, bend  # type: ignore
 
 from otterdog.jsonnet import JsonnetConfig
 from otterdog.models import (
@@ -31,8 +32,59 @@ from otterdog.utils import (
     snake_to_camel_case,
 )
 
+# maps the actor allowance settings to the provider keys of their resolved node ids
+_ACTOR_ALLOWANCES = {
+    "push_restrictions": "pushActorIds",
+    "review_dismissal_allowances": "reviewDismissalActorIds",
+    "bypass_pull_request_allowances": "bypassPullRequestActorIds",
+    "bypass_force_push_allowances": "bypassForcePushActorIds",
+}
+
+# list settings that are ignored when the associated setting has the given value
+_IGNORED_LIST_SETTINGS = (
+    ("restricts_review_dismissals", False, "review_dismissal_allowances", FailureType.INFO),
+    ("allows_force_pushes", True, "bypass_force_push_allowances", FailureType.INFO),
+    ("requires_status_checks", False, "required_status_checks", FailureType.INFO),
+    ("requires_deployments", False, "required_deployment_environments", FailureType.WARNING),
+    ("restricts_pushes", False, "push_restrictions", FailureType.WARNING),
+)
+
+# settings that need special treatment when converted to provider data
+_SPECIAL_PROVIDER_KEYS = frozenset({"requires_pull_request", "required_status_checks", *_ACTOR_ALLOWANCES})
+
+
+def _transform_status_checks(checks: list[dict[str, Any]]) -> list[str]:
+    """Converts the required status checks as returned by the provider to their model representation"""
+    result = []
+    for check in checks:
+        app = check["app"]
+        context = check["context"]
+
+        if app is None:
+            result.append(sys.intern(f"any:{context}"))
+        else:
+            app_slug = app["slug"]
+            if app_slug == "github-actions":
+                result.append(sys.intern(context))
+            else:
+                result.append(sys.intern(f"{app_slug}:{context}"))
+
+    return result
+
 
-@dataclasses.dataclass
+def _parse_status_check(check: str) -> tuple[str, str]:
+    """
+    Parses a required status check in the form '[<app_slug>:]<context>' into a tuple (app_slug, context).
+    Checks without an explicit app are associated with the 'github-actions' app.
+    """
+    if ":" in check:
+        app_slug, context = check.split(":", 1)
+        return app_slug, context
+    else:
+        return "github-actions", check
+
+
+@dataclasses.dataclass(slots=True)
 class BranchProtectionRule(ModelObject):
     """
     Represents a Branch Protection Rule within a Repository.
@@ -82,14 +134,17 @@ class BranchProtectionRule(ModelObject):
     def validate(self, context: ValidationContext, parent_object: Any) -> None:
         # when requires_approving_reviews is false, issue a warning if dependent settings
         # are still set to non default values.
-
-        if self.requires_pull_request is False:
+        # note: the boolean settings are tri-state (True, False or UNSET, which is falsy),
+        #       so they are explicitly compared by identity.
+        requires_pull_request = self.requires_pull_request
+        if requires_pull_request is False:
             if is_set_and_valid(self.required_approving_review_count):
                 context.add_failure(
                     FailureType.INFO,
-                    f"{self.get_model_header(parent_object)} has"
-                    f" 'requires_pull_request' disabled but 'required_approving_review_count' "
-                    f"is set to '{self.required_approving_review_count}', setting will be ignored.",
+                    "%s has 'requires_pull_request' disabled but 'required_approving_review_count' "
+                    "is set to '%s', setting will be ignored.",
+                    self.get_model_header(parent_object),
+                    self.required_approving_review_count,
                 )
 
             for key in [
@@ -101,9 +156,9 @@ class BranchProtectionRule(ModelObject):
                 if self.__getattribute__(key) is True:
                     context.add_failure(
                         FailureType.WARNING,
-                        f"{self.get_model_header(parent_object)} has"
-                        f" 'requires_pull_request' disabled but '{key}' "
-                        f"is enabled, setting will be ignored.",
+                        "%s has 'requires_pull_request' disabled but '%s' is enabled, setting will be ignored.",
+                        self.get_model_header(parent_object),
+                        key,
                     )
 
             for key in [
@@ -114,124 +169,69 @@ class BranchProtectionRule(ModelObject):
                 if not is_unset(value) and len(value) > 0:
                     context.add_failure(
                         FailureType.WARNING,
-                        f"{self.get_model_header(parent_object)} has"
-                        f" 'requires_pull_request' disabled but '{key}' "
-                        f"is set to '{value}', setting will be ignored.",
+                        "%s has 'requires_pull_request' disabled but '%s' is set to '%s', setting will be ignored.",
+                        self.get_model_header(parent_object),
+                        key,
+                        value,
                     )
 
         # required_approving_review_count must be defined when requires_pull_request is enabled
         required_approving_review_count = self.required_approving_review_count
-        if self.requires_pull_request is True and not is_unset(required_approving_review_count):
+        if requires_pull_request is True and not is_unset(required_approving_review_count):
             if required_approving_review_count is None or required_approving_review_count < 0:
                 context.add_failure(
                     FailureType.ERROR,
-                    f"{self.get_model_header(parent_object)} has"
-                    f" 'requires_pull_request' enabled but 'required_approving_review_count' "
-                    f"is not set (must be set to a non negative number).",
+                    "%s has 'requires_pull_request' enabled but 'required_approving_review_count' "
+                    "is not set (must be set to a non negative number).",
+                    self.get_model_header(parent_object),
                 )
 
-        # if 'review_dismissal_allowances' is disabled, issue a warning if review_dismissal_allowances is non-empty.
-        review_dismissal_allowances = self.review_dismissal_allowances
-        if (
-            self.restricts_review_dismissals is False
-            and is_set_and_valid(review_dismissal_allowances)
-            and len(review_dismissal_allowances) > 0
-        ):
-            context.add_failure(
-                FailureType.INFO,
-                f"{self.get_model_header(parent_object)} has"
-                f" 'restricts_review_dismissals' disabled but "
-                f"'review_dismissal_allowances' is set to '{self.review_dismissal_allowances}', "
-                f"setting will be ignored.",
-            )
-
-        # if 'allows_force_pushes' is enabled, issue an error if bypass_force_push_allowances is non-empty.
-        if (
-            self.allows_force_pushes is True
-            and is_set_and_valid(self.bypass_force_push_allowances)
-            and len(self.bypass_force_push_allowances) > 0
-        ):
-            context.add_failure(
-                FailureType.INFO,
-                f"{self.get_model_header(parent_object)} has"
-                f" 'allows_force_pushes' enabled but "
-                f"'bypass_force_push_allowances' is set to '{self.bypass_force_push_allowances}', "
-                f"setting will be ignored.",
-            )
-
-        # if 'requires_status_checks' is disabled, issue a warning if required_status_checks is non-empty.
-        required_status_checks = self.required_status_checks
-        if (
-            self.requires_status_checks is False
-            and is_set_and_valid(required_status_checks)
-            and len(required_status_checks) > 0
-        ):
-            context.add_failure(
-                FailureType.INFO,
-                f"{self.get_model_header(parent_object)} has"
-                f" 'requires_status_checks' disabled but "
-                f"'required_status_checks' is set to '{self.required_status_checks}', "
-                f"setting will be ignored.",
-            )
-
-        # if 'requires_deployments' is disabled, issue a warning if required_deployment_environments is non-empty.
-        if (
-            self.requires_deployments is False
-            and is_set_and_valid(self.required_deployment_environments)
-            and len(self.required_deployment_environments) > 0
-        ):
-            context.add_failure(
-                FailureType.WARNING,
-                f"{self.get_model_header(parent_object)} has "
-                f"'requires_deployments' disabled but "
-                f"'required_deployment_environments' is set to "
-                f"'{self.required_deployment_environments}', setting will be ignored.",
-            )
+        # issue a failure for list settings that are non-empty while they are ignored due to another setting.
+        for key, value, list_key, failure_type in _IGNORED_LIST_SETTINGS:
+            if self.__getattribute__(key) is value:
+                list_value = self.__getattribute__(list_key)
+                if is_set_and_valid(list_value) and len(list_value) > 0:
+                    context.add_failure(
+                        failure_type,
+                        "%s has '%s' %s but '%s' is set to '%s', setting will be ignored.",
+                        self.get_model_header(parent_object),
+                        key,
+                        "enabled" if value else "disabled",
+                        list_key,
+                        list_value,
+                    )
 
-        if self.requires_deployments is True and len(self.required_deployment_environments) > 0:
+        required_deployment_environments = self.required_deployment_environments
+        if self.requires_deployments is True and len(required_deployment_environments) > 0:
             from .repository import Repository
 
             environments = cast(Repository, parent_object).environments
 
             environments_by_name = associate_by_key(environments, lambda x: x.name)
-            for env_name in self.required_deployment_environments:
+            for env_name in required_deployment_environments:
                 if env_name not in environments_by_name:
                     context.add_failure(
                         FailureType.ERROR,
-                        f"{self.get_model_header(parent_object)} requires deployment environment "
-                        f"'{env_name}' which is not defined in the repository itself.",
+                        "%s requires deployment environment '%s' which is not defined in the repository itself.",
+                        self.get_model_header(parent_object),
+                        env_name,
                     )
 
-        # if 'restricts_pushes' is disabled, issue a warning if push_restrictions is non-empty.
-        if (
-            self.restricts_pushes is False
-            and is_set_and_valid(self.push_restrictions)
-            and len(self.push_restrictions) > 0
-        ):
-            context.add_failure(
-                FailureType.WARNING,
-                f"{self.get_model_header(parent_object)} has"
-                f" 'restricts_pushes' disabled but "
-                f"'push_restrictions' is set to '{self.push_restrictions}', "
-                f"setting will be ignored.",
-            )
-
         # if 'restricts_pushes' is disabled, issue a warning if blocks_creations is enabled.
         if self.restricts_pushes is False and self.blocks_creations is True:
             context.add_failure(
                 FailureType.WARNING,
-                f"{self.get_model_header(parent_object)} has"
-                f" 'restricts_pushes' disabled but "
-                f"'blocks_creations' is set to '{self.blocks_creations}', "
-                f"setting will be ignored.",
+                "%s has 'restricts_pushes' disabled but 'blocks_creations' is set to '%s', setting will be ignored.",
+                self.get_model_header(parent_object),
+                self.blocks_creations,
             )
 
         # if 'lock_branch' is disabled, issue a warning if lock_allows_fetch_and_merge is enabled.
         if self.lock_branch is False and self.lock_allows_fetch_and_merge is True:
             context.add_failure(
                 FailureType.WARNING,
-                f"{self.get_model_header(parent_object)} has 'lock_branch' disabled but "
-                f"'lock_allows_fetch_and_merge' enabled, setting will be ignored.",
+                "%s has 'lock_branch' disabled but 'lock_allows_fetch_and_merge' enabled, setting will be ignored.",
+                self.get_model_header(parent_object),
             )
 
     def include_field_for_diff_computation(self, field: dataclasses.Field) -> bool:
@@ -276,11 +276,34 @@ class BranchProtectionRule(ModelObject):
     def include_field_for_patch_computation(self, field: dataclasses.Field) -> bool:
         return True
 
+    @classmethod
+    @cache
+    def _model_mapping(cls) -> dict[str, Any]:
+        return {field.name: OptionalS(field.name, default=UNSET) for field in cls.all_fields()}
+
+    @classmethod
+    @cache
+    def _provider_mapping(cls) -> dict[str, Any]:
+        mapping = {field.name: OptionalS(snake_to_camel_case(field.name), default=UNSET) for field in cls.all_fields()}
+        mapping["requires_pull_request"] = OptionalS("requiresApprovingReviews", default=UNSET)
+        mapping["required_status_checks"] = OptionalS("requiredStatusChecks", default=[]) >> F(_transform_status_checks)
+        return mapping
+
+    @classmethod
+    @cache
+    def _provider_field_keys(cls) -> dict[str, str]:
+        return {
+            field.name: snake_to_camel_case(field.name)
+            for field in cls.provider_fields()
+            if field.name not in _SPECIAL_PROVIDER_KEYS
+        }
+
     @classmethod
     def from_model_data(cls, data: dict[str, Any]) -> BranchProtectionRule:
-        mapping: dict[str, Any] = {k: OptionalS(k, default=UNSET) for k in map(lambda x: x.name, cls.all_fields())}
+        mapping = cls._model_mapping()
 
         if "requires_approving_reviews" in data:
+            mapping = mapping.copy()
             mapping["requires_pull_request"] = S("requires_approving_reviews")
 
         return cls(**bend(mapping, data))
@@ -288,100 +311,58 @@ class BranchProtectionRule(ModelObject):
     @classmethod
     def from_provider_data(cls, org_id: str, data: dict[str, Any]) -> BranchProtectionRule:
         mapping = cls.get_mapping_from_provider(org_id, data)
-        return cls(**bend(mapping, data))
+        rule = cls(**bend(mapping, data))
+        # the same patterns are used by lots of rules, share the string instances
+        if isinstance(rule.pattern, str):
+            rule.pattern = sys.intern(rule.pattern)
+        return rule
 
     @classmethod
     def get_mapping_from_provider(cls, org_id: str, data: dict[str, Any]) -> dict[str, Any]:
-        mapping = {k: OptionalS(snake_to_camel_case(k), default=UNSET) for k in map(lambda x: x.name, cls.all_fields())}
-        mapping["requires_pull_request"] = OptionalS("requiresApprovingReviews", default=UNSET)
-
-        def transform_app(x):
-            app = x["app"]
-            context = x["context"]
-
-            if app is None:
-                app_prefix = "any:"
-            else:
-                app_slug = app["slug"]
-                if app_slug == "github-actions":
-                    app_prefix = ""
-                else:
-                    app_prefix = f"{app_slug}:"
-
-            return f"{app_prefix}{context}"
-
-        mapping["required_status_checks"] = OptionalS("requiredStatusChecks", default=[]) >> Forall(
-            lambda x: transform_app(x)
-        )
-        return mapping
+        return cls._provider_mapping().copy()
 
     @classmethod
     async def get_mapping_to_provider(
         cls, org_id: str, data: dict[str, Any], provider: GitHubProvider
     ) -> dict[str, Any]:
+        provider_field_keys = cls._provider_field_keys()
         mapping: dict[str, Any] = {
-            snake_to_camel_case(field.name): S(field.name)
-            for field in cls.provider_fields()
-            if not is_unset(data.get(field.name, UNSET))
+            provider_field_keys[key]: S(key)
+            for key, value in data.items()
+            if key in provider_field_keys and not is_unset(value)
         }
 
+        # fast path, e.g. for changes that do not touch any setting that needs special treatment
+        if _SPECIAL_PROVIDER_KEYS.isdisjoint(data):
+            return mapping
+
         if "requires_pull_request" in data:
-            mapping.pop("requiresPullRequest")
             mapping["requiresApprovingReviews"] = K(data["requires_pull_request"])
 
-        if "push_restrictions" in data:
-            mapping.pop("pushRestrictions")
-            push_restrictions = data["push_restrictions"]
-            if is_set_and_valid(push_restrictions):
-                actor_ids = await provider.get_actor_node_ids(push_restrictions)
-                mapping["pushActorIds"] = K(actor_ids)
-
-        if "review_dismissal_allowances" in data:
-            mapping.pop("reviewDismissalAllowances")
-            review_dismissal_allowances = data["review_dismissal_allowances"]
-            if is_set_and_valid(review_dismissal_allowances):
-                actor_ids = await provider.get_actor_node_ids(review_dismissal_allowances)
-                mapping["reviewDismissalActorIds"] = K(actor_ids)
-
-        if "bypass_pull_request_allowances" in data:
-            mapping.pop("bypassPullRequestAllowances")
-            bypass_pull_request_allowances = data["bypass_pull_request_allowances"]
-            if is_set_and_valid(bypass_pull_request_allowances):
-                actor_ids = await provider.get_actor_node_ids(bypass_pull_request_allowances)
-                mapping["bypassPullRequestActorIds"] = K(actor_ids)
-
-        if "bypass_force_push_allowances" in data:
-            mapping.pop("bypassForcePushAllowances")
-            bypass_force_push_allowances = data["bypass_force_push_allowances"]
-            if is_set_and_valid(bypass_force_push_allowances):
-                actor_ids = await provider.get_actor_node_ids(bypass_force_push_allowances)
-                mapping["bypassForcePushActorIds"] = K(actor_ids)
+        actor_allowances: dict[str, Any] = {}
+        for key, provider_key in _ACTOR_ALLOWANCES.items():
+            allowances = data.get(key)
+            if is_set_and_valid(allowances):
+                actor_allowances[provider_key] = allowances
+
+        if len(actor_allowances) > 0:
+            # resolve the actors of all allowances at once to avoid duplicate lookups
+            actor_names = {actor for allowances in actor_allowances.values() for actor in allowances}
+            actor_ids = await provider.get_actor_node_ids_by_name(sorted(actor_names))
+
+            for provider_key, allowances in actor_allowances.items():
+                mapping[provider_key] = K([actor_ids[actor] for actor in allowances if actor in actor_ids])
 
         if "required_status_checks" in data:
-            mapping.pop("requiredStatusChecks")
             required_status_checks = data["required_status_checks"]
             if is_set_and_valid(required_status_checks):
-                app_slugs = set()
-
-                for check in required_status_checks:
-                    if ":" in check:
-                        app_slug, context = re.split(":", check, 1)
-
-                        if app_slug != "any":
-                            app_slugs.add(app_slug)
-                    else:
-                        app_slugs.add("github-actions")
+                parsed_checks = [_parse_status_check(check) for check in required_status_checks]
+                app_slugs = {app_slug for app_slug, _ in parsed_checks if app_slug != "any"}
 
                 app_ids = await provider.get_app_node_ids(app_slugs)
 
                 transformed_checks = []
-                for check in required_status_checks:
-                    if ":" in check:
-                        app_slug, context = re.split(":", check, 1)
-                    else:
-                        app_slug = "github-actions"
-                        context = check
-
+                for app_slug, context in parsed_checks:
                     if app_slug == "any":
                         transformed_checks.append({"appId": "any", "context": context})
                     else:
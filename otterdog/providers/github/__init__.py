@@ -8,6 +8,7 @@
 
 import json
 from asyncio import CancelledError
+from collections.abc import Iterable
 from typing import Any
 
 from importlib_resources import files
@@ -38,6 +39,11 @@ class GitHubProvider:
     def __init__(self, credentials: Credentials | None):
         self._credentials = credentials
 
+        # caches for resolved actor and app ids, the same actors and apps are
+        # typically referenced by lots of settings within an organization
+        self._actor_ids_cache: dict[str, tuple[str, tuple[int, str]]] = {}
+        self._app_ids_cache: dict[str, tuple[int, str]] = {}
+
         if credentials is not None:
             self._init_clients()
 
@@ -323,40 +329,71 @@ class GitHubProvider:
             repo_ids.append(repo_data["id"])
         return repo_ids
 
-    async def get_actor_node_ids(self, actor_names: list[str]) -> list[str]:
-        return list(map(lambda x: x[1][1], await self.get_actor_ids_with_type(actor_names)))
+    async def get_actor_node_ids_by_name(self, actor_names: Iterable[str]) -> dict[str, str]:
+        result = {}
+        for actor in actor_names:
+            actor_ids_with_type = await self._get_actor_ids_with_type(actor)
+            if actor_ids_with_type is not None:
+                result[actor] = actor_ids_with_type[1][1]
+
+        return result
 
     async def get_actor_ids_with_type(self, actor_names: list[str]) -> list[tuple[str, tuple[int, str]]]:
         result = []
         for actor in actor_names:
-            if actor.startswith("@"):
-                # if it starts with a @, it's either a user or team:
-                #    - team-names contains a / in its slug
-                #    - user-names are not allowed to contain a /
-                if "/" in actor:
-                    try:
-                        result.append(("Team", await self.rest_api.org.get_team_ids(actor[1:])))
-                    except RuntimeError:
-                        utils.print_warn(f"team '{actor[1:]}' does not exist, skipping")
-                else:
-                    try:
-                        result.append(("User", await self.rest_api.user.get_user_ids(actor[1:])))
-                    except RuntimeError:
-                        utils.print_warn(f"user '{actor[1:]}' does not exist, skipping")
+            actor_ids_with_type = await self._get_actor_ids_with_type(actor)
+            if actor_ids_with_type is not None:
+                result.append(actor_ids_with_type)
+
+        return result
+
+    async def _get_actor_ids_with_type(self, actor: str) -> tuple[str, tuple[int, str]] | None:
+        actor_ids_with_type = self._actor_ids_cache.get(actor)
+        if actor_ids_with_type is None:
+            # failed lookups are not cached, they might be caused by transient errors
+            actor_ids_with_type = await self._resolve_actor_ids_with_type(actor)
+            if actor_ids_with_type is not None:
+                self._actor_ids_cache[actor] = actor_ids_with_type
+
+        return actor_ids_with_type
+
+    async def _resolve_actor_ids_with_type(self, actor: str) -> tuple[str, tuple[int, str]] | None:
+        if actor.startswith("@"):
+            # if it starts with a @, it's either a user or team:
+            #    - team-names contains a / in its slug
+            #    - user-names are not allowed to contain a /
+            if "/" in actor:
+                try:
+                    return "Team", await self.rest_api.org.get_team_ids(actor[1:])
+                except RuntimeError:
+                    utils.print_warn(f"team '{actor[1:]}' does not exist, skipping")
             else:
-                # it's an app
                 try:
-                    result.append(("App", await self.rest_api.app.get_app_ids(actor)))
+                    return "User", await self.rest_api.user.get_user_ids(actor[1:])
                 except RuntimeError:
-                    utils.print_warn(f"app '{actor}' does not exist, skipping")
+                    utils.print_warn(f"user '{actor[1:]}' does not exist, skipping")
+        else:
+            # it's an app
+            try:
+                return "App", await self._get_app_ids(actor)
+            except RuntimeError:
+                utils.print_warn(f"app '{actor}' does not exist, skipping")
 
-        return result
+        return None
 
     async def get_app_node_ids(self, app_names: set[str]) -> dict[str, str]:
-        return {app_name: (await self.rest_api.app.get_app_ids(app_name))[1] for app_name in app_names}
+        return {app_name: (await self._get_app_ids(app_name))[1] for app_name in app_names}
+
+    async def get_app_ids(self, app_names: set[str]) -> dict[str, int]:
+        return {app_name: (await self._get_app_ids(app_name))[0] for app_name in app_names}
+
+    async def _get_app_ids(self, app_name: str) -> tuple[int, str]:
+        app_ids = self._app_ids_cache.get(app_name)
+        if app_ids is None:
+            app_ids = await self.rest_api.app.get_app_ids(app_name)
+            self._app_ids_cache[app_name] = app_ids
 
-    async def get_app_ids(self, app_names: set[str]) -> dict[str, str]:
-        return {app_name: (await self.rest_api.app.get_app_ids(app_name))[0] for app_name in app_names}
+        return app_ids
 
     async def get_ref_for_pull_request(self, org_id: str, repo_name: str, pull_number: str) -> str:
         return await self.rest_api.repo.get_ref_for_pull_request(org_id, repo_name, pull_number)
@@ -31,8 +31,8 @@ class ModelTest(ABC, unittest.IsolatedAsyncioTestCase):
 
     @property
     def provider(self):
-        async def get_actor_node_ids(actors):
-            return [f"id_{actor[1:]}" for actor in actors]
+        async def get_actor_node_ids_by_name(actors):
+            return {actor: f"id_{actor[1:]}" for actor in actors}
 
         async def get_app_node_ids(app_names):
             return {app: f"id_{app}" for app in app_names}
@@ -48,7 +48,7 @@ class ModelTest(ABC, unittest.IsolatedAsyncioTestCase):
 
         provider = MagicMock()
 
-        provider.get_actor_node_ids = MagicMock(side_effect=get_actor_node_ids)
+        provider.get_actor_node_ids_by_name = MagicMock(side_effect=get_actor_node_ids_by_name)
         provider.get_app_node_ids = MagicMock(side_effect=get_app_node_ids)
         provider.get_actor_ids_with_type = MagicMock(side_effect=get_actor_ids_with_type)
 
@@ -6,6 +6,8 @@
 #  SPDX-License-Identifier: EPL-2.0
 #  *******************************************************************************
 
+from unittest.mock import MagicMock
+
 from otterdog.models.branch_protection_rule import BranchProtectionRule
 from otterdog.utils import UNSET, Change
 
@@ -88,6 +90,28 @@ class BranchProtectionRuleTest(ModelTest):
             {"appId": "any", "context": "Run CI"},
         ]
 
+    async def test_to_provider_resolves_actors_once(self):
+        model_data = self.model_data
+        model_data["push_restrictions"] = ["@netomi", "@eclipse/team"]
+        model_data["review_dismissal_allowances"] = ["@eclipse/team"]
+        model_data["bypass_pull_request_allowances"] = ["@unknown", "@netomi"]
+        model_data["bypass_force_push_allowances"] = ["@netomi"]
+        bpr = BranchProtectionRule.from_model_data(model_data)
+
+        async def get_actor_node_ids_by_name(actors):
+            return {actor: f"id_{actor[1:]}" for actor in actors if actor != "@unknown"}
+
+        provider = self.provider
+        provider.get_actor_node_ids_by_name = MagicMock(side_effect=get_actor_node_ids_by_name)
+
+        provider_data = await bpr.to_provider_data(self.org_id, provider)
+
+        provider.get_actor_node_ids_by_name.assert_called_once_with(["@eclipse/team", "@netomi", "@unknown"])
+        assert provider_data["pushActorIds"] == ["id_netomi", "id_eclipse/team"]
+        assert provider_data["reviewDismissalActorIds"] == ["id_eclipse/team"]
+        assert provider_data["bypassPullRequestActorIds"] == ["id_netomi"]
+        assert provider_data["bypassForcePushActorIds"] == ["id_netomi"]
+
     async def test_changes_to_provider(self):
         current = BranchProtectionRule.from_model_data(self.model_data)
         other = BranchProtectionRule.from_model_data(self.model_data)
@@ -105,6 +129,23 @@ class BranchProtectionRuleTest(ModelTest):
             {"appId": "any", "context": "Run CI"},
         ]
 
+    async def test_changes_to_provider_without_special_settings(self):
+        current = BranchProtectionRule.from_model_data(self.model_data)
+        other = BranchProtectionRule.from_model_data(self.model_data)
+
+        other.allows_deletions = True
+        other.required_approving_review_count = 1
+
+        provider = self.provider
+        changes = current.get_difference_from(other)
+        provider_data = await BranchProtectionRule.changes_to_provider(self.org_id, changes, provider)
+
+        assert len(provider_data) == 2
+        assert provider_data["allowsDeletions"] is False
+        assert provider_data["requiredApprovingReviewCount"] == 2
+        provider.get_actor_node_ids_by_name.assert_not_called()
+        provider.get_app_node_ids.assert_not_called()
+
     def test_patch(self):
         current = BranchProtectionRule.from_model_data(self.model_data)
         default = BranchProtectionRule.from_model_data(self.model_data)
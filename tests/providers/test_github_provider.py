@@ -0,0 +1,42 @@
+#  *******************************************************************************
+#  Copyright (c) 2024 Eclipse Foundation and others.
+#  This program and the accompanying materials are made available
+#  under the terms of the Eclipse Public License 2.0
+#  which is available at http://www.eclipse.org/legal/epl-v20.html
+#  SPDX-License-Identifier: EPL-2.0
+#  *******************************************************************************
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from otterdog.providers.github import GitHubProvider
+
+
+class GitHubProviderTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.provider = GitHubProvider(None)
+        self.provider.rest_api = MagicMock()
+        self.provider.rest_api.user.get_user_ids = AsyncMock(return_value=(1, "id_netomi"))
+        self.provider.rest_api.app.get_app_ids = AsyncMock(return_value=(2, "id_eclipse-eca-validation"))
+
+    async def test_actor_ids_are_cached(self):
+        assert await self.provider.get_actor_node_ids_by_name(["@netomi"]) == {"@netomi": "id_netomi"}
+        assert await self.provider.get_actor_node_ids_by_name(["@netomi"]) == {"@netomi": "id_netomi"}
+
+        self.provider.rest_api.user.get_user_ids.assert_awaited_once_with("netomi")
+
+    async def test_app_ids_are_cached(self):
+        assert await self.provider.get_app_node_ids({"eclipse-eca-validation"}) == {
+            "eclipse-eca-validation": "id_eclipse-eca-validation"
+        }
+        assert await self.provider.get_app_ids({"eclipse-eca-validation"}) == {"eclipse-eca-validation": 2}
+
+        self.provider.rest_api.app.get_app_ids.assert_awaited_once_with("eclipse-eca-validation")
+
+    async def test_failed_actor_lookups_are_not_cached(self):
+        self.provider.rest_api.user.get_user_ids.side_effect = [RuntimeError("rate limited"), (1, "id_netomi")]
+
+        assert await self.provider.get_actor_node_ids_by_name(["@netomi"]) == {}
+        assert await self.provider.get_actor_node_ids_by_name(["@netomi"]) == {"@netomi": "id_netomi"}
+
+        assert self.provider.rest_api.user.get_user_ids.await_count == 2